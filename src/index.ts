@@ -60,6 +60,291 @@ interface TavilyMapResponse {
   response_time: number;
 }
 
+type TavilyEndpoint = 'search' | 'extract' | 'crawl' | 'map' | 'research';
+
+// Errors with a dedicated message, keyed by HTTP status
+const API_ERROR_MESSAGES: Record<number, string> = {
+  401: 'Invalid API key',
+  429: 'Usage limit exceeded',
+};
+
+// Define available tools once; the list is static for the lifetime of the server
+const TOOLS: Tool[] = [
+  {
+    name: "tavily_search",
+    description: "Search the web for current information on any topic. Use for news, facts, or data beyond your knowledge cutoff. Returns snippets and source URLs.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        query: { 
+          type: "string", 
+          description: "Search query" 
+        },
+        search_depth: {
+          type: "string",
+          enum: ["basic","advanced","fast","ultra-fast"],
+          description: "The depth of the search. 'basic' for generic results, 'advanced' for more thorough search, 'fast' for optimized low latency with high relevance, 'ultra-fast' for prioritizing latency above all else",
+          default: "basic"
+        },
+        topic : {
+          type: "string",
+          enum: ["general"],
+          description: "The category of the search. This will determine which of our agents will be used for the search",
+          default: "general"
+        },
+        time_range: {
+          type: "string",
+          description: "The time range back from the current date to include in the search results",
+          enum: ["day", "week", "month", "year"]
+        },
+        start_date: {
+          type: "string",
+          description: "Will return all results after the specified start date. Required to be written in the format YYYY-MM-DD.",
+          default: "",
+        },
+        end_date: { 
+          type: "string",
+          description: "Will return all results before the specified end date. Required to be written in the format YYYY-MM-DD",
+          default: "",
+        },
+        max_results: { 
+          type: "number", 
+          description: "The maximum number of search results to return",
+          default: 5,
+          minimum: 5,
+          maximum: 20
+        },
+        include_images: { 
+          type: "boolean", 
+          description: "Include a list of query-related images in the response",
+          default: false,
+        },
+        include_image_descriptions: { 
+          type: "boolean", 
+          description: "Include a list of query-related images and their descriptions in the response",
+          default: false
+        },
+        include_raw_content: {
+          type: "boolean",
+          description: "Include the cleaned and parsed HTML content of each search result",
+          default: false
+        },
+        include_domains: {
+          type: "array",
+          items: { type: "string" },
+          description: "A list of domains to specifically include in the search results, if the user asks to search on specific sites set this to the domain of the site",
+          default: []
+        },
+        exclude_domains: {
+          type: "array",
+          items: { type: "string" },
+          description: "List of domains to specifically exclude, if the user asks to exclude a domain set this to the domain of the site",
+          default: []
+        },
+        country: {
+          type: "string",
+          description: "Boost search results from a specific country. Must be a full country name (e.g., 'United States', 'Japan', 'Germany'). ISO country codes (e.g., 'us', 'jp') are not supported. Available only if topic is general. See https://docs.tavily.com/documentation/api-reference/search for the full list of supported countries.",
+          default: ""
+        },
+        include_favicon: {
+          type: "boolean",
+          description: "Whether to include the favicon URL for each result",
+          default: false
+        },
+        exact_match: {
+          type: "boolean",
+          description: "Only return results containing the exact phrase(s) in quotes in your query"
+        }
+      },
+      required: ["query"]
+    }
+  },
+  {
+    name: "tavily_extract",
+    description: "Extract content from URLs. Returns raw page content in markdown or text format.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        urls: { 
+          type: "array",
+          items: { type: "string" },
+          description: "List of URLs to extract content from"
+        },
+        extract_depth: { 
+          type: "string",
+          enum: ["basic", "advanced"],
+          description: "Use 'advanced' for LinkedIn, protected sites, or tables/embedded content",
+          default: "basic"
+        },
+        include_images: {
+          type: "boolean",
+          description: "Include images from pages",
+          default: false
+        },
+        format: {
+          type: "string",
+          enum: ["markdown", "text"],
+          description: "Output format",
+          default: "markdown"
+        },
+        include_favicon: {
+          type: "boolean",
+          description: "Include favicon URLs",
+          default: false
+        },
+        query: {
+          type: "string",
+          description: "Query to rerank content chunks by relevance"
+        }
+      },
+      required: ["urls"]
+    }
+  },
+  {
+    name: "tavily_crawl",
+    description: "Crawl a website starting from a URL. Extracts content from pages with configurable depth and breadth.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        url: {
+          type: "string",
+          description: "The root URL to begin the crawl"
+        },
+        max_depth: {
+          type: "integer",
+          description: "Max depth of the crawl. Defines how far from the base URL the crawler can explore.",
+          default: 1,
+          minimum: 1
+        },
+        max_breadth: {
+          type: "integer",
+          description: "Max number of links to follow per level of the tree (i.e., per page)",
+          default: 20,
+          minimum: 1
+        },
+        limit: {
+          type: "integer",
+          description: "Total number of links the crawler will process before stopping",
+          default: 50,
+          minimum: 1
+        },
+        instructions: {
+          type: "string",
+          description: "Natural language instructions for the crawler. Instructions specify which types of pages the crawler should return."
+        },
+        select_paths: {
+          type: "array",
+          items: { type: "string" },
+          description: "Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)",
+          default: []
+        },
+        select_domains: {
+          type: "array",
+          items: { type: "string" },
+          description: "Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)",
+          default: []
+        },
+        allow_external: {
+          type: "boolean",
+          description: "Whether to return external links in the final response",
+          default: true
+        },
+        extract_depth: {
+          type: "string",
+          enum: ["basic", "advanced"],
+          description: "Advanced extraction retrieves more data, including tables and embedded content, with higher success but may increase latency",
+          default: "basic"
+        },
+        format: {
+          type: "string",
+          enum: ["markdown","text"],
+          description: "The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.",
+          default: "markdown"
+        },
+        include_favicon: { 
+          type: "boolean", 
+          description: "Whether to include the favicon URL for each result",
+          default: false,
+        },
+      },
+      required: ["url"]
+    }
+  },
+  {
+    name: "tavily_map",
+    description: "Map a website's structure. Returns a list of URLs found starting from the base URL.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        url: {
+          type: "string",
+          description: "The root URL to begin the mapping"
+        },
+        max_depth: {
+          type: "integer",
+          description: "Max depth of the mapping. Defines how far from the base URL the crawler can explore",
+          default: 1,
+          minimum: 1
+        },
+        max_breadth: {
+          type: "integer",
+          description: "Max number of links to follow per level of the tree (i.e., per page)",
+          default: 20,
+          minimum: 1
+        },
+        limit: {
+          type: "integer",
+          description: "Total number of links the crawler will process before stopping",
+          default: 50,
+          minimum: 1
+        },
+        instructions: {
+          type: "string",
+          description: "Natural language instructions for the crawler"
+        },
+        select_paths: {
+          type: "array",
+          items: { type: "string" },
+          description: "Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)",
+          default: []
+        },
+        select_domains: {
+          type: "array",
+          items: { type: "string" },
+          description: "Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)",
+          default: []
+        },
+        allow_external: {
+          type: "boolean",
+          description: "Whether to return external links in the final response",
+          default: true
+        }
+      },
+      required: ["url"]
+    }
+  },
+  {
+    name: "tavily_research",
+    description: "Perform comprehensive research on a given topic or question. Use this tool when you need to gather information from multiple sources to answer a question or complete a task. Returns a detailed response based on the research findings. Rate limit: 20 requests per minute.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        input: {
+          type: "string",
+          description: "A comprehensive description of the research task"
+        },
+        model: {
+          type: "string",
+          enum: ["mini", "pro", "auto"],
+          description: "Defines the degree of depth of the research. 'mini' is good for narrow tasks with few subtopics. 'pro' is good for broad tasks with many subtopics. 'auto' automatically selects the best model.",
+          default: "auto"
+        }
+      },
+      required: ["input"]
+    }
+  },
+];
+
 class TavilyClient {
   // Core client properties
   private server: Server;
@@ -80,6 +365,8 @@ class TavilyClient {
     research: 'https://docs.tavily.com/documentation/api-reference/endpoint/research',
   };
 
+  private defaultParameters?: Record<string, any>;
+
   constructor() {
     this.server = new Server(
       {
@@ -126,9 +413,18 @@ class TavilyClient {
      * with parameter names and their default values.
      * Example: DEFAULT_PARAMETERS='{"search_depth":"basic","include_images":true}'
      * 
+     * The value is parsed on first use and cached for the lifetime of the server.
+     * 
      * Returns:
      *   Object with default parameter values, or empty object if env var is not present or invalid.
      */
+    if (this.defaultParameters === undefined) {
+      this.defaultParameters = this.parseDefaultParameters();
+    }
+    return this.defaultParameters;
+  }
+
+  private parseDefaultParameters(): Record<string, any> {
     try {
       const parametersEnv = process.env.DEFAULT_PARAMETERS;
       
@@ -157,283 +453,7 @@ class TavilyClient {
 
   private setupToolHandlers(): void {
     this.server.setRequestHandler(ListToolsRequestSchema, async () => {
-      // Define available tools: tavily_search and tavily_extract
-      const tools: Tool[] = [
-        {
-          name: "tavily_search",
-          description: "Search the web for current information on any topic. Use for news, facts, or data beyond your knowledge cutoff. Returns snippets and source URLs.",
-          inputSchema: {
-            type: "object",
-            properties: {
-              query: { 
-                type: "string", 
-                description: "Search query" 
-              },
-              search_depth: {
-                type: "string",
-                enum: ["basic","advanced","fast","ultra-fast"],
-                description: "The depth of the search. 'basic' for generic results, 'advanced' for more thorough search, 'fast' for optimized low latency with high relevance, 'ultra-fast' for prioritizing latency above all else",
-                default: "basic"
-              },
-              topic : {
-                type: "string",
-                enum: ["general"],
-                description: "The category of the search. This will determine which of our agents will be used for the search",
-                default: "general"
-              },
-              time_range: {
-                type: "string",
-                description: "The time range back from the current date to include in the search results",
-                enum: ["day", "week", "month", "year"]
-              },
-              start_date: {
-                type: "string",
-                description: "Will return all results after the specified start date. Required to be written in the format YYYY-MM-DD.",
-                default: "",
-              },
-              end_date: { 
-                type: "string",
-                description: "Will return all results before the specified end date. Required to be written in the format YYYY-MM-DD",
-                default: "",
-              },
-              max_results: { 
-                type: "number", 
-                description: "The maximum number of search results to return",
-                default: 5,
-                minimum: 5,
-                maximum: 20
-              },
-              include_images: { 
-                type: "boolean", 
-                description: "Include a list of query-related images in the response",
-                default: false,
-              },
-              include_image_descriptions: { 
-                type: "boolean", 
-                description: "Include a list of query-related images and their descriptions in the response",
-                default: false
-              },
-              include_raw_content: {
-                type: "boolean",
-                description: "Include the cleaned and parsed HTML content of each search result",
-                default: false
-              },
-              include_domains: {
-                type: "array",
-                items: { type: "string" },
-                description: "A list of domains to specifically include in the search results, if the user asks to search on specific sites set this to the domain of the site",
-                default: []
-              },
-              exclude_domains: {
-                type: "array",
-                items: { type: "string" },
-                description: "List of domains to specifically exclude, if the user asks to exclude a domain set this to the domain of the site",
-                default: []
-              },
-              country: {
-                type: "string",
-                description: "Boost search results from a specific country. Must be a full country name (e.g., 'United States', 'Japan', 'Germany'). ISO country codes (e.g., 'us', 'jp') are not supported. Available only if topic is general. See https://docs.tavily.com/documentation/api-reference/search for the full list of supported countries.",
-                default: ""
-              },
-              include_favicon: {
-                type: "boolean",
-                description: "Whether to include the favicon URL for each result",
-                default: false
-              },
-              exact_match: {
-                type: "boolean",
-                description: "Only return results containing the exact phrase(s) in quotes in your query"
-              }
-            },
-            required: ["query"]
-          }
-        },
-        {
-          name: "tavily_extract",
-          description: "Extract content from URLs. Returns raw page content in markdown or text format.",
-          inputSchema: {
-            type: "object",
-            properties: {
-              urls: { 
-                type: "array",
-                items: { type: "string" },
-                description: "List of URLs to extract content from"
-              },
-              extract_depth: { 
-                type: "string",
-                enum: ["basic", "advanced"],
-                description: "Use 'advanced' for LinkedIn, protected sites, or tables/embedded content",
-                default: "basic"
-              },
-              include_images: {
-                type: "boolean",
-                description: "Include images from pages",
-                default: false
-              },
-              format: {
-                type: "string",
-                enum: ["markdown", "text"],
-                description: "Output format",
-                default: "markdown"
-              },
-              include_favicon: {
-                type: "boolean",
-                description: "Include favicon URLs",
-                default: false
-              },
-              query: {
-                type: "string",
-                description: "Query to rerank content chunks by relevance"
-              }
-            },
-            required: ["urls"]
-          }
-        },
-        {
-          name: "tavily_crawl",
-          description: "Crawl a website starting from a URL. Extracts content from pages with configurable depth and breadth.",
-          inputSchema: {
-            type: "object",
-            properties: {
-              url: {
-                type: "string",
-                description: "The root URL to begin the crawl"
-              },
-              max_depth: {
-                type: "integer",
-                description: "Max depth of the crawl. Defines how far from the base URL the crawler can explore.",
-                default: 1,
-                minimum: 1
-              },
-              max_breadth: {
-                type: "integer",
-                description: "Max number of links to follow per level of the tree (i.e., per page)",
-                default: 20,
-                minimum: 1
-              },
-              limit: {
-                type: "integer",
-                description: "Total number of links the crawler will process before stopping",
-                default: 50,
-                minimum: 1
-              },
-              instructions: {
-                type: "string",
-                description: "Natural language instructions for the crawler. Instructions specify which types of pages the crawler should return."
-              },
-              select_paths: {
-                type: "array",
-                items: { type: "string" },
-                description: "Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)",
-                default: []
-              },
-              select_domains: {
-                type: "array",
-                items: { type: "string" },
-                description: "Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)",
-                default: []
-              },
-              allow_external: {
-                type: "boolean",
-                description: "Whether to return external links in the final response",
-                default: true
-              },
-              extract_depth: {
-                type: "string",
-                enum: ["basic", "advanced"],
-                description: "Advanced extraction retrieves more data, including tables and embedded content, with higher success but may increase latency",
-                default: "basic"
-              },
-              format: {
-                type: "string",
-                enum: ["markdown","text"],
-                description: "The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.",
-                default: "markdown"
-              },
-              include_favicon: { 
-                type: "boolean", 
-                description: "Whether to include the favicon URL for each result",
-                default: false,
-              },
-            },
-            required: ["url"]
-          }
-        },
-        {
-          name: "tavily_map",
-          description: "Map a website's structure. Returns a list of URLs found starting from the base URL.",
-          inputSchema: {
-            type: "object",
-            properties: {
-              url: {
-                type: "string",
-                description: "The root URL to begin the mapping"
-              },
-              max_depth: {
-                type: "integer",
-                description: "Max depth of the mapping. Defines how far from the base URL the crawler can explore",
-                default: 1,
-                minimum: 1
-              },
-              max_breadth: {
-                type: "integer",
-                description: "Max number of links to follow per level of the tree (i.e., per page)",
-                default: 20,
-                minimum: 1
-              },
-              limit: {
-                type: "integer",
-                description: "Total number of links the crawler will process before stopping",
-                default: 50,
-                minimum: 1
-              },
-              instructions: {
-                type: "string",
-                description: "Natural language instructions for the crawler"
-              },
-              select_paths: {
-                type: "array",
-                items: { type: "string" },
-                description: "Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)",
-                default: []
-              },
-              select_domains: {
-                type: "array",
-                items: { type: "string" },
-                description: "Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)",
-                default: []
-              },
-              allow_external: {
-                type: "boolean",
-                description: "Whether to return external links in the final response",
-                default: true
-              }
-            },
-            required: ["url"]
-          }
-        },
-        {
-          name: "tavily_research",
-          description: "Perform comprehensive research on a given topic or question. Use this tool when you need to gather information from multiple sources to answer a question or complete a task. Returns a detailed response based on the research findings. Rate limit: 20 requests per minute.",
-          inputSchema: {
-            type: "object",
-            properties: {
-              input: {
-                type: "string",
-                description: "A comprehensive description of the research task"
-              },
-              model: {
-                type: "string",
-                enum: ["mini", "pro", "auto"],
-                description: "Defines the degree of depth of the research. 'mini' is good for narrow tasks with few subtopics. 'pro' is good for broad tasks with many subtopics. 'auto' automatically selects the best model.",
-                default: "auto"
-              }
-            },
-            required: ["input"]
-          }
-        },
-      ];
-      return { tools };
+      return { tools: TOOLS };
     });
 
     this.server.setRequestHandler(CallToolRequestSchema, async (request: any) => {
@@ -581,135 +601,96 @@ class TavilyClient {
     console.error("Tavily MCP server running on stdio");
   }
 
-  async search(params: any): Promise<TavilyResponse> {
+  private async post<T>(endpoint: TavilyEndpoint, payload: Record<string, any>): Promise<T> {
     try {
-      const endpoint = this.baseURLs.search;
-      
-      const defaults = this.getDefaultParameters();
-      
-      // Prepare the request payload
-      const searchParams: any = {
-        query: params.query,
-        search_depth: params.search_depth,
-        topic: params.topic,
-        time_range: params.time_range,
-        max_results: params.max_results,
-        include_images: params.include_images,
-        include_image_descriptions: params.include_image_descriptions,
-        include_raw_content: params.include_raw_content,
-        include_domains: params.include_domains || [],
-        exclude_domains: params.exclude_domains || [],
-        country: params.country,
-        include_favicon: params.include_favicon,
-        start_date: params.start_date,
-        end_date: params.end_date,
-        exact_match: params.exact_match,
-        api_key: API_KEY,
-      };
-      
-      // Apply default parameters
-      for (const key in searchParams) {
-        if (key in defaults) {
-          searchParams[key] = defaults[key];
-        }
-      }
-      
-      // We have to set defaults due to the issue with optional parameter types or defaults = None
-      // Because of this, we have to set the time_range to None if start_date or end_date is set
-      // or else start_date and end_date will always cause errors when sent
-      if ((searchParams.start_date || searchParams.end_date) && searchParams.time_range) {
-        searchParams.time_range = undefined;
-      }
-      
-      // Remove empty values
-      const cleanedParams: any = {};
-      for (const key in searchParams) {
-        const value = searchParams[key];
-        // Skip empty strings, null, undefined, and empty arrays
-        if (value !== "" && value !== null && value !== undefined && 
-            !(Array.isArray(value) && value.length === 0)) {
-          cleanedParams[key] = value;
-        }
-      }
-      
-      const response = await this.axiosInstance.post(endpoint, cleanedParams);
+      const response = await this.axiosInstance.post(this.baseURLs[endpoint], {
+        ...payload,
+        api_key: API_KEY
+      });
       return response.data;
     } catch (error: any) {
-      if (error.response?.status === 401) {
-        throw new Error(`Invalid API key. Documentation: ${this.docsURLs.search}`);
-      } else if (error.response?.status === 429) {
-        throw new Error(`Usage limit exceeded. Documentation: ${this.docsURLs.search}`);
-      }
-      throw error;
+      throw this.toApiError(error, endpoint);
     }
   }
 
-  async extract(params: any): Promise<TavilyResponse> {
-    try {
-      const response = await this.axiosInstance.post(this.baseURLs.extract, {
-        ...params,
-        api_key: API_KEY
-      });
-      return response.data;
-    } catch (error: any) {
-      if (error.response?.status === 401) {
-        throw new Error(`Invalid API key. Documentation: ${this.docsURLs.extract}`);
-      } else if (error.response?.status === 429) {
-        throw new Error(`Usage limit exceeded. Documentation: ${this.docsURLs.extract}`);
+  private toApiError(error: unknown, endpoint: TavilyEndpoint): unknown {
+    // Replace known API failures with a readable message, pass anything else through untouched
+    const status = axios.isAxiosError(error) ? error.response?.status : undefined;
+    const message = status !== undefined ? API_ERROR_MESSAGES[status] : undefined;
+    return message ? new Error(`${message}. Documentation: ${this.docsURLs[endpoint]}`) : error;
+  }
+
+  async search(params: any): Promise<TavilyResponse> {
+    const defaults = this.getDefaultParameters();
+    
+    // Prepare the request payload
+    const searchParams: any = {
+      query: params.query,
+      search_depth: params.search_depth,
+      topic: params.topic,
+      time_range: params.time_range,
+      max_results: params.max_results,
+      include_images: params.include_images,
+      include_image_descriptions: params.include_image_descriptions,
+      include_raw_content: params.include_raw_content,
+      include_domains: params.include_domains || [],
+      exclude_domains: params.exclude_domains || [],
+      country: params.country,
+      include_favicon: params.include_favicon,
+      start_date: params.start_date,
+      end_date: params.end_date,
+      exact_match: params.exact_match,
+    };
+    
+    // Apply default parameters and remove empty values in a single pass
+    const cleanedParams: any = {};
+    for (const key in searchParams) {
+      const value = key in defaults ? defaults[key] : searchParams[key];
+      // Skip empty strings, null, undefined, and empty arrays
+      if (value !== "" && value !== null && value !== undefined && 
+          !(Array.isArray(value) && value.length === 0)) {
+        cleanedParams[key] = value;
       }
-      throw error;
     }
+    
+    // We have to set defaults due to the issue with optional parameter types or defaults = None
+    // Because of this, we have to drop the time_range if start_date or end_date is set
+    // or else start_date and end_date will always cause errors when sent
+    if (cleanedParams.start_date || cleanedParams.end_date) {
+      delete cleanedParams.time_range;
+    }
+    
+    return this.post<TavilyResponse>('search', cleanedParams);
+  }
+
+  async extract(params: any): Promise<TavilyResponse> {
+    return this.post<TavilyResponse>('extract', params);
   }
 
   async crawl(params: any): Promise<TavilyCrawlResponse> {
-    try {
-      const response = await this.axiosInstance.post(this.baseURLs.crawl, {
-        ...params,
-        api_key: API_KEY
-      });
-      return response.data;
-    } catch (error: any) {
-      if (error.response?.status === 401) {
-        throw new Error(`Invalid API key. Documentation: ${this.docsURLs.crawl}`);
-      } else if (error.response?.status === 429) {
-        throw new Error(`Usage limit exceeded. Documentation: ${this.docsURLs.crawl}`);
-      }
-      throw error;
-    }
+    return this.post<TavilyCrawlResponse>('crawl', params);
   }
 
   async map(params: any): Promise<TavilyMapResponse> {
-    try {
-      const response = await this.axiosInstance.post(this.baseURLs.map, {
-        ...params,
-        api_key: API_KEY
-      });
-      return response.data;
-    } catch (error: any) {
-      if (error.response?.status === 401) {
-        throw new Error(`Invalid API key. Documentation: ${this.docsURLs.map}`);
-      } else if (error.response?.status === 429) {
-        throw new Error(`Usage limit exceeded. Documentation: ${this.docsURLs.map}`);
-      }
-      throw error;
-    }
+    return this.post<TavilyMapResponse>('map', params);
   }
 
   async research(params: any): Promise<TavilyResearchResponse> {
     const INITIAL_POLL_INTERVAL = 2000; // 2 seconds in ms
     const MAX_POLL_INTERVAL = 10000; // 10 seconds in ms
     const POLL_BACKOFF_FACTOR = 1.5;
+    const POLL_JITTER = 0.2; // up to +20% random delay per poll
+    const MAX_CONSECUTIVE_POLL_FAILURES = 5;
     const MAX_PRO_MODEL_POLL_DURATION = 900000; // 15 minutes in ms
     const MAX_MINI_MODEL_POLL_DURATION = 300000; // 5 minutes in ms
 
     try {
-      const response = await this.axiosInstance.post(this.baseURLs.research, {
+      const data = await this.post<any>('research', {
         input: params.input,
-        model: params.model || 'auto',
-        api_key: API_KEY
+        model: params.model || 'auto'
       });
 
-      const requestId = response.data.request_id;
+      const requestId = data.request_id;
       if (!requestId) {
         return { error: `No request_id returned from research endpoint. Documentation: ${this.docsURLs.research}` };
       }
@@ -719,18 +700,29 @@ class TavilyClient {
         ? MAX_MINI_MODEL_POLL_DURATION
         : MAX_PRO_MODEL_POLL_DURATION;
 
+      // Measure against the wall clock so time spent in poll requests counts towards the limit
+      const deadline = Date.now() + maxPollDuration;
       let pollInterval = INITIAL_POLL_INTERVAL;
-      let totalElapsed = 0;
+      let consecutivePollFailures = 0;
 
-      while (totalElapsed < maxPollDuration) {
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
-        totalElapsed += pollInterval;
+      while (Date.now() < deadline) {
+        const jitteredInterval = pollInterval * (1 + Math.random() * POLL_JITTER);
+        await new Promise(resolve => setTimeout(resolve, jitteredInterval));
+
+        // Don't start a status request the budget can no longer cover
+        const remaining = deadline - Date.now();
+        if (remaining <= 0) {
+          break;
+        }
 
         try {
+          // Bound each status request by the remaining budget
           const pollResponse = await this.axiosInstance.get(
-            `${this.baseURLs.research}/${requestId}`
+            `${this.baseURLs.research}/${requestId}`,
+            { timeout: remaining }
           );
 
+          consecutivePollFailures = 0;
           const status = pollResponse.data.status;
 
           if (status === 'completed') {
@@ -745,10 +737,18 @@ class TavilyClient {
           }
 
         } catch (pollError: any) {
-          if (pollError.response?.status === 404) {
+          const pollStatus = pollError.response?.status;
+          if (pollStatus === 404) {
             return { error: 'Research task not found' };
           }
-          throw pollError;
+          // Network errors, rate limiting and server errors are transient; back off and poll again,
+          // but surface the underlying error once they keep failing
+          const isTransient = axios.isAxiosError(pollError)
+            && (pollStatus === undefined || pollStatus === 429 || pollStatus >= 500);
+          consecutivePollFailures++;
+          if (!isTransient || consecutivePollFailures >= MAX_CONSECUTIVE_POLL_FAILURES) {
+            throw pollError;
+          }
         }
 
         pollInterval = Math.min(pollInterval * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL);
@@ -756,12 +756,7 @@ class TavilyClient {
 
       return { error: `Research task timed out. Documentation: ${this.docsURLs.research}` };
     } catch (error: any) {
-      if (error.response?.status === 401) {
-        throw new Error(`Invalid API key. Documentation: ${this.docsURLs.research}`);
-      } else if (error.response?.status === 429) {
-        throw new Error(`Usage limit exceeded. Documentation: ${this.docsURLs.research}`);
-      }
-      throw error;
+      throw this.toApiError(error, 'research');
     }
   }
 }